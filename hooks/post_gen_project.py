@@ -12,39 +12,96 @@ import re
 import shutil
 import subprocess
 import sys
+import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
-# Make generated project's scripts importable (for parse_requires_python)
-_PROJ_ROOT = Path.cwd()
-_LIB_DIR = _PROJ_ROOT / "scripts" / "lib"
-if _LIB_DIR.exists():
-    # Ensure imports like `scripts.lib...` resolve by adding project root
-    # (adding the scripts dir itself would require a nested `scripts/scripts`)
-    sys.path.insert(0, str(_PROJ_ROOT))
-
-try:  # Resolve helper at import time to avoid function-level imports
-    from scripts.lib.python_versions import parse_requires_python  # type: ignore
-except Exception:
-    # Fallback: minimal local implementation (should rarely be needed)
-    def parse_requires_python(spec: str):  # type: ignore
-        m1 = re.search(r">=?\s*3\.(\d+)", spec)
-        m2 = re.search(r"<\s*3\.(\d+)", spec)
-        lo = int(m1.group(1)) if m1 else 10
-        hi = (int(m2.group(1)) - 1) if m2 else lo
-        return f"3.{lo}", f"3.{hi}"
+try:  # orjson is optional and only speeds up parsing
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+PLACEHOLDERS_FILE = ".cookiecutter_placeholders.txt"
+_PRUNED_DIRS = frozenset({".git", ".venv", "node_modules", "__pycache__"})
+
+if sys.platform == "win32":
+    UV_INSTALLER = 'powershell -ExecutionPolicy ByPass -c "irm https://astral.sh/uv/install.ps1 | iex"'
+else:
+    UV_INSTALLER = "curl -LsSf https://astral.sh/uv/install.sh | sh"
+
+# Digits only, so pre-releases like 3.13.0rc1 or 3.14.0a1 never match
+_FULL_VERSION_RE = re.compile(r"\d+\.\d+\.\d+", re.ASCII)
+_MINOR_RE = re.compile(r"\d+\.\d+", re.ASCII)
+_SHA1_RE = re.compile(r"[0-9a-f]{40}")
+_SPEC_MIN_RE = re.compile(r">=?\s*3\.(\d+)")
+_SPEC_MAX_RE = re.compile(r"<\s*3\.(\d+)")
+
+ENDOFLIFE_URL = "https://endoflife.date/api/python.json"
+VERSIONS_CACHE_TTL = 24 * 60 * 60  # seconds
+DISCOVERY_TIMEOUT = 10  # seconds
+DISCOVERY_HEAD_START = 2  # seconds uv gets before the fallbacks start
+ENDOFLIFE_TIMEOUT = 5  # seconds
+LS_REMOTE_TIMEOUT = 10  # seconds
+
+# Set by the caller, never by the hook (it runs as a child of cookiecutter, so
+# nothing it exports outlives it): PYTHONIC_TEMPLATE_UV=1/0 declares whether uv
+# is available and skips the probe; PYTHONIC_TEMPLATE_SKIP_INSTALL=1 skips
+# dependency setup entirely
+UV_ENV_VAR = "PYTHONIC_TEMPLATE_UV"
+SKIP_INSTALL_ENV_VAR = "PYTHONIC_TEMPLATE_SKIP_INSTALL"
+
+
+def _run(
+    cmd: str | list[str],
+    *,
+    check: bool = False,
+    shell: bool = False,
+    capture: bool = True,
+    cwd: str | None = None,
+    timeout: float | None = None,
+) -> subprocess.CompletedProcess:
+    """Run a command, capturing stdout and stderr as text.
+
+    Commands never read stdin, so it is closed for the child; nothing can hang
+    waiting for input.
+
+    Pass ``capture=False`` for chatty, progress-oriented commands: their output
+    goes straight to the hook's own stdout/stderr instead of being buffered.
+    """
+    if not capture:
+        return subprocess.run(
+            cmd,
+            shell=shell,
+            cwd=cwd,
+            check=check,
+            stdin=subprocess.DEVNULL,
+            timeout=timeout,
+        )
+
+    return subprocess.run(
+        cmd,
+        shell=shell,
+        cwd=cwd,
+        check=check,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
 
 
 def run_command(
-    cmd: str, check: bool = True, shell: bool = True
+    cmd: str, check: bool = True, shell: bool = True, capture: bool = True
 ) -> subprocess.CompletedProcess:
     """Run a shell command and return the result."""
-    print(f"Running: {cmd}")
+    # Flush so our log line lands before any output the child writes directly
+    print(f"Running: {cmd}", flush=True)
     try:
-        result = subprocess.run(
-            cmd, shell=shell, check=check, capture_output=True, text=True
-        )
+        result = _run(cmd, check=check, shell=shell, capture=capture)
         if result.stdout:
             print(result.stdout)
         return result
@@ -57,10 +114,35 @@ def run_command(
         return e
 
 
-def run_silent(cmd: list[str]) -> tuple[int, str]:
+def run_batch(
+    cmds: list[str], check: bool = True, capture: bool = True
+) -> subprocess.CompletedProcess:
+    """Run shell commands in order, stopping at the first failure.
+
+    Each command runs exactly once. A failing step is reported by name and,
+    with ``check``, raised as ``CalledProcessError``.
+    """
+    result = None
+    for cmd in cmds:
+        result = run_command(cmd, check=False, capture=capture)
+        if result.returncode != 0:
+            print(f"[WARN] Step failed (exit {result.returncode}): {cmd}")
+            if result.stderr:
+                print(f"Error output: {result.stderr}")
+            if check:
+                raise subprocess.CalledProcessError(
+                    result.returncode, cmd, result.stdout, result.stderr
+                )
+            break
+    return result
+
+
+def run_silent(
+    cmd: list[str], cwd: str | None = None, timeout: float | None = None
+) -> tuple[int, str]:
     """Run command silently and return (returncode, stdout)."""
     try:
-        result = subprocess.run(cmd, check=False, capture_output=True, text=True)
+        result = _run(cmd, cwd=cwd, timeout=timeout)
         if result.returncode != 0 and result.stderr:
             print(f"[DEBUG] Command failed: {' '.join(cmd)}\n{result.stderr}")
         return result.returncode, result.stdout or ""
@@ -68,24 +150,31 @@ def run_silent(cmd: list[str]) -> tuple[int, str]:
         return 1, ""
 
 
+def parse_requires_python(spec: str) -> tuple[str, str]:
+    """Parse a requires-python spec and return (min, max) minors.
+
+    Copy of ``parse_requires_python`` in ``scripts/lib/python_versions.py`` at
+    the template repository root, which the generated project doesn't ship.
+    Keep the two in sync; ``test_parse_requires_python_matches_script`` checks.
+    """
+    min_m = _SPEC_MIN_RE.search(spec)
+    max_m = _SPEC_MAX_RE.search(spec)
+    lo = int(min_m.group(1)) if min_m else 10
+    hi = (int(max_m.group(1)) - 1) if max_m else lo
+    return f"3.{lo}", f"3.{hi}"
+
+
 def normalize_version(version_str: str) -> str | None:
-    """Normalize version string to X.Y.Z format."""
+    """Return a stable X.Y.Z version string, or None for anything else."""
     version_str = version_str.strip()
-    if not re.match(r"^\d+\.\d+\.\d+$", version_str):
-        return None
-    return version_str
+    return version_str if _FULL_VERSION_RE.fullmatch(version_str) else None
 
 
 def get_unique_minors(stable_versions: list[str]) -> list[str]:
-    """Extract unique minor versions (X.Y) from stable versions, keeping latest patch."""
-    best_versions = {}
-    for version in stable_versions:
-        major, minor, patch = map(int, version.split("."))
-        key = f"{major}.{minor}"
-        if key not in best_versions or (major, minor, patch) > best_versions[key]:
-            best_versions[key] = (major, minor, patch)
-
-    return sorted(best_versions.keys(), key=lambda x: tuple(map(int, x.split("."))))
+    """Extract the sorted unique minor versions (X.Y) from X.Y.Z versions."""
+    # Only X.Y is returned, so the patch level never needs comparing
+    minors = {tuple(map(int, version.split(".")[:2])) for version in stable_versions}
+    return [f"{major}.{minor}" for major, minor in sorted(minors)]
 
 
 def filter_min_versions(minors: list[str], required_min: str) -> list[str]:
@@ -102,13 +191,14 @@ def filter_min_versions(minors: list[str], required_min: str) -> list[str]:
 def discover_from_uv() -> list[str] | None:
     """Discover Python versions using uv."""
     returncode, output = run_silent(
-        ["uv", "python", "list", "--releases", "--format", "json"]
+        ["uv", "python", "list", "--releases", "--format", "json"],
+        timeout=DISCOVERY_TIMEOUT,
     )
     if returncode != 0:
         return None
 
     try:
-        data = json.loads(output)
+        data = _json_loads(output)
     except Exception:
         return None
 
@@ -124,29 +214,28 @@ def discover_from_uv() -> list[str] | None:
 
 def discover_from_pyenv() -> list[str] | None:
     """Discover Python versions using pyenv."""
-    returncode, output = run_silent(["pyenv", "install", "-l"])
-    if returncode != 0 or not output.strip():
+    # subprocess.run kills the child on timeout, so a hung pyenv can't outlive
+    # discovery (the listing is only a few KB, so buffering it is fine)
+    returncode, output = run_silent(
+        ["pyenv", "install", "-l"], timeout=DISCOVERY_TIMEOUT
+    )
+    if returncode != 0:
         return None
 
-    stable_versions = []
-    for line in output.splitlines():
-        version = normalize_version(line.strip())
-        if version:
-            stable_versions.append(version)
-
+    stable_versions = [
+        version for line in output.splitlines() if (version := normalize_version(line))
+    ]
     return get_unique_minors(stable_versions) if stable_versions else None
 
 
 def discover_from_endoflife() -> list[str] | None:
     """Discover Python versions using endoflife.date API (stdlib only)."""
+    request = urllib.request.Request(
+        ENDOFLIFE_URL, headers={"User-Agent": "pythonic-template"}
+    )
     try:
-        with urllib.request.urlopen(
-            "https://endoflife.date/api/python.json", timeout=5
-        ) as resp:
-            output = resp.read().decode("utf-8")
-        if not output.strip():
-            return None
-        data = json.loads(output)
+        with urllib.request.urlopen(request, timeout=ENDOFLIFE_TIMEOUT) as resp:
+            data = _json_loads(resp.read())
     except Exception:
         return None
 
@@ -160,29 +249,96 @@ def discover_from_endoflife() -> list[str] | None:
         else:
             # Fallback to cycle.0 if latest is not parseable
             cycle = entry.get("cycle", "")
-            if re.match(r"^\d+\.\d+$", cycle):
+            if _MINOR_RE.fullmatch(cycle):
                 stable_versions.append(f"{cycle}.0")
 
     return get_unique_minors(stable_versions) if stable_versions else None
 
 
+def _versions_cache_path() -> Path:
+    """Return the on-disk cache location for discovered Python versions."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "pythonic-template" / "versions.json"
+
+
+def _load_versions_cache(cache: Path) -> list[str] | None:
+    """Return cached versions if the cache is fresh, otherwise None."""
+    try:
+        data = _json_loads(cache.read_bytes())
+        versions = data["versions"]
+        # A hand-edited or truncated cache is a miss, not a crash later on
+        valid = isinstance(versions, list) and all(isinstance(v, str) for v in versions)
+        if valid and versions and time.time() - data["ts"] < VERSIONS_CACHE_TTL:
+            return versions
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    return None
+
+
+def _save_versions_cache(cache: Path, versions: list[str]):
+    """Atomically write discovered versions to the cache, ignoring failures."""
+    payload = {"ts": time.time(), "versions": versions}
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, cache)
+    except OSError as e:
+        print(f"[PYTHON] Could not cache versions: {e}")
+
+
+@lru_cache(maxsize=1)
 def discover_python_versions() -> list[str]:
     """Discover available Python versions, falling back through multiple methods."""
     print("[PYTHON] Discovering available Python versions...")
 
-    for method_name, method_func in [
+    # Available releases change rarely; reuse a recent answer across renders
+    cache = _versions_cache_path()
+    versions = _load_versions_cache(cache)
+    if versions:
+        print(f"[PYTHON] Using cached versions from {cache}: {versions}")
+        return versions
+
+    methods = [
         ("uv", discover_from_uv),
         ("pyenv", discover_from_pyenv),
         ("endoflife.date", discover_from_endoflife),
-    ]:
-        try:
-            print(f"[PYTHON] Trying {method_name}...")
-            versions = method_func()
+    ]
+    # Walk the methods in priority order and take the first answer, waiting on
+    # each only until the shared deadline; once it has passed, only methods
+    # that already finished count. uv gets a head start, so the slower
+    # fallbacks (a pyenv scan, a network request) only run when it is slow or
+    # comes up empty.
+    executor = ThreadPoolExecutor(max_workers=len(methods))
+    try:
+        deadline = time.monotonic() + DISCOVERY_TIMEOUT
+        (first_name, first_func), *fallbacks = methods
+        print(f"[PYTHON] Trying {first_name}...")
+        first = executor.submit(first_func)
+        futures = {first_name: first}
+        wait([first], timeout=min(DISCOVERY_HEAD_START, DISCOVERY_TIMEOUT))
+        if not (first.done() and first.exception() is None and first.result()):
+            for method_name, method_func in fallbacks:
+                print(f"[PYTHON] Trying {method_name}...")
+                futures[method_name] = executor.submit(method_func)
+
+        for method_name, future in futures.items():
+            try:
+                versions = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except TimeoutError:
+                print(f"[PYTHON] {method_name} timed out after {DISCOVERY_TIMEOUT}s")
+                continue
+            except Exception as e:
+                print(f"[PYTHON] {method_name} failed: {e}")
+                continue
             if versions:
                 print(f"[PYTHON] Found versions via {method_name}: {versions}")
+                _save_versions_cache(cache, versions)
                 return versions
-        except Exception as e:
-            print(f"[PYTHON] {method_name} failed: {e}")
+    finally:
+        # Running workers are still joined at interpreter exit; every backend
+        # has its own timeout within DISCOVERY_TIMEOUT, which bounds that wait
+        executor.shutdown(wait=False, cancel_futures=True)
 
     # Fallback to reasonable defaults derived from the environment
     try:
@@ -199,8 +355,6 @@ def discover_python_versions() -> list[str]:
 
 def setup_python_versions():
     """Set up Python version tokens using spec parsing and discovery."""
-    # parse_requires_python is resolved at module import time
-
     # Accept either a bare minor (e.g., "3.12") or a full spec (e.g., ">=3.12,<3.14")
     raw_spec = "{{ cookiecutter.python_version }}".strip()
     print(f"[PYTHON] Python version input from template: {raw_spec}")
@@ -251,20 +405,25 @@ def setup_python_versions():
         "docs/development/contributing.md",
     ]
 
+    # Replace all tokens in a single pass over the raw bytes of each file,
+    # so files without tokens are never decoded
+    tokens_b = {k.encode("utf-8"): v.encode("utf-8") for k, v in tokens.items()}
+    token_re = re.compile(b"|".join(re.escape(token) for token in tokens_b))
+
     project_root = Path.cwd()
     for file_path in target_files:
         full_path = project_root / file_path
         if not full_path.exists():
             continue
 
-        content = full_path.read_text(encoding="utf-8")
-        original_content = content
-
-        for token, replacement in tokens.items():
-            content = content.replace(token, replacement)
+        data = full_path.read_bytes()
+        new_data = data
+        if b"__PY_" in data or b"__RELEASE_DATE__" in data:
+            new_data = token_re.sub(lambda m: tokens_b[m.group(0)], data)
 
         # Ensure README prominently shows minimum Python version
         if file_path == "README.md":
+            content = new_data.decode("utf-8")
             py_line = f"Python {tokens['__PY_MIN__']}+"
             if py_line not in content:
                 # Insert after the short description paragraph if present
@@ -286,27 +445,15 @@ def setup_python_versions():
                         content = content + f"\n\nRequires {py_line}.\n"
                 except Exception:
                     content = content + f"\n\nRequires {py_line}.\n"
+            new_data = content.encode("utf-8")
 
-        if content != original_content:
-            full_path.write_text(content, encoding="utf-8")
+        if new_data != data:
+            full_path.write_bytes(new_data)
             print(f"[PYTHON] Updated {file_path} with Python version tokens")
 
     print("[PYTHON] Python version setup completed!")
 
 
-def _run_command(cmd: list[str], cwd: str | None = None) -> str | None:
-    """Run a command and return stdout if successful, None otherwise."""
-    try:
-        result = subprocess.run(
-            cmd, cwd=cwd, check=False, capture_output=True, text=True
-        )
-        return (
-            result.stdout.strip() if result.returncode == 0 and result.stdout else None
-        )
-    except Exception:
-        return None
-
-
 def setup_cruft_tracking():
     """Populate .cruft.json 'commit' deterministically without altering 'template'."""
     cruft_path = Path.cwd() / ".cruft.json"
@@ -316,7 +463,7 @@ def setup_cruft_tracking():
 
     try:
         # Load and parse .cruft.json safely
-        data = json.loads(cruft_path.read_text(encoding="utf-8"))
+        data = _json_loads(cruft_path.read_bytes())
 
         # If already set, leave it alone (idempotent)
         if data.get("commit"):
@@ -329,7 +476,7 @@ def setup_cruft_tracking():
         # Prefer explicit environment-provided commit hashes (offline friendly)
         for env_var in ("COOKIECUTTER_TEMPLATE_COMMIT", "GITHUB_SHA"):
             val = os.environ.get(env_var)
-            if val and re.fullmatch(r"[0-9a-f]{40}", val):
+            if val and _SHA1_RE.fullmatch(val):
                 known_commit = val
                 print(f"[CRUFT] Using commit from env {env_var}: {val[:8]}")
                 break
@@ -341,7 +488,8 @@ def setup_cruft_tracking():
             and Path(template).exists()
             and (Path(template) / ".git").exists()
         ):
-            known_commit = _run_command(["git", "rev-parse", "HEAD"], cwd=template)
+            returncode, output = run_silent(["git", "rev-parse", "HEAD"], cwd=template)
+            known_commit = output.strip() if returncode == 0 else None
             if known_commit:
                 print(f"[CRUFT] Found commit from template path: {template}")
 
@@ -351,9 +499,12 @@ def setup_cruft_tracking():
             and isinstance(template, str)
             and template.startswith(("http://", "https://", "git@", "git://"))
         ):
-            remote_output = _run_command(["git", "ls-remote", template, "HEAD"])
-            if remote_output:
-                known_commit = remote_output.split()[0]
+            # Bounded so an unreachable remote can't stall the whole hook
+            returncode, output = run_silent(
+                ["git", "ls-remote", template, "HEAD"], timeout=LS_REMOTE_TIMEOUT
+            )
+            if returncode == 0 and output.strip():
+                known_commit = output.split()[0]
                 print(f"[CRUFT] Found commit from remote template: {template}")
 
         # Method 3: Last-ditch local probing (without persisting paths)
@@ -368,7 +519,10 @@ def setup_cruft_tracking():
                     probes.append(Path.home() / repo_name)
             for probe in probes:
                 if probe and (probe / ".git").exists():
-                    sha = _run_command(["git", "rev-parse", "HEAD"], cwd=str(probe))
+                    returncode, output = run_silent(
+                        ["git", "rev-parse", "HEAD"], cwd=str(probe)
+                    )
+                    sha = output.strip() if returncode == 0 else None
                     if sha:
                         known_commit = sha
                         print(
@@ -383,7 +537,9 @@ def setup_cruft_tracking():
                 if isinstance(template, str) and template
                 else "pythonic-template"
             )
-            known_commit = hashlib.sha1(basis.encode("utf-8")).hexdigest()
+            known_commit = hashlib.blake2b(
+                basis.encode("utf-8"), digest_size=20
+            ).hexdigest()
             print("[CRUFT] Could not resolve template commit; using synthetic SHA")
 
         # Update only the commit field, preserving template URL
@@ -395,97 +551,209 @@ def setup_cruft_tracking():
         print(f"[CRUFT] Failed to set up cruft tracking: {e}")
 
 
-def main():
-    """Initialize the project after generation."""
-    project_dir = Path.cwd()
-    print(f"[INIT] Initializing project in {project_dir}")
-
-    # Set up dynamic Python version configuration first
-    setup_python_versions()
-
-    # Set up cruft tracking
-    setup_cruft_tracking()
-
-    # Clean up any placeholder files or directories left from template rendering
-    for path in project_dir.rglob("__remove__*"):
+def _find_placeholders(root: str | Path):
+    """Yield ``__remove__*`` paths under ``root``, skipping VCS and cache dirs."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.startswith("__remove__"):
+                yield entry.path
+            elif entry.is_dir(follow_symlinks=False) and entry.name not in _PRUNED_DIRS:
+                yield from _find_placeholders(entry.path)
+
+
+def remove_placeholders(project_dir: Path):
+    """Remove placeholder paths rendered for disabled template options.
+
+    Uses the list shipped in ``.cookiecutter_placeholders.txt`` and only falls
+    back to scanning the whole tree when that file is missing.
+    """
+    sentinel = project_dir / PLACEHOLDERS_FILE
+    if sentinel.exists():
+        lines = sentinel.read_text(encoding="utf-8").splitlines()
+        paths = [
+            project_dir / line.strip()
+            for line in lines
+            if line.strip() and not line.startswith("#")
+        ]
+        sentinel.unlink()
+    else:
+        paths = [Path(path) for path in _find_placeholders(project_dir)]
+
+    for path in paths:
         if path.is_dir():
             shutil.rmtree(path)
-        else:
+        elif path.exists():
             path.unlink()
 
-    # Initialize git repository
+
+def init_git_repository():
+    """Initialize an empty git repository on the ``main`` branch."""
     try:
         run_command("git init -b main")
         print("[OK] Git repository initialized")
     except subprocess.CalledProcessError:
         print("[WARN] Git initialization failed - you may need to install git")
 
-    # Check if uv is available, install if not
-    uv_available = False
-    try:
-        run_command("uv --version")
-        uv_available = True
+
+def ensure_uv() -> bool:
+    """Check if uv is available, installing it if not.
+
+    A caller rendering many projects can set ``PYTHONIC_TEMPLATE_UV`` to skip
+    the probe.
+    """
+    declared = os.environ.get(UV_ENV_VAR)
+    if declared in {"0", "1"}:
+        return declared == "1"
+    return _probe_or_install_uv()
+
+
+def _probe_or_install_uv() -> bool:
+    """Find uv on PATH, installing it if missing; return whether it is usable.
+
+    Tries the official installer (curl | sh, or PowerShell on Windows) first
+    and falls back to ``pip install uv``.
+    """
+    # A PATH lookup is enough to detect uv; no need to spawn it
+    if shutil.which("uv"):
         print("[OK] uv package manager detected")
-    except subprocess.CalledProcessError:
-        print("[INSTALL] Installing uv package manager...")
-        try:
-            # Install uv via pipx
-            run_command("pip install --user pipx")
-            run_command("pipx install uv")
-            uv_available = True
+        return True
+    print("[INSTALL] Installing uv package manager...")
+
+    # The standalone installer puts uv in ~/.local/bin, which may not be on
+    # PATH yet; `pip install --user` uses the same directory on POSIX
+    local_bin = str(Path.home() / ".local" / "bin")
+    os.environ["PATH"] = os.pathsep.join([local_bin, os.environ.get("PATH", "")])
+
+    # Prefer the official installer (a single static binary download) and only
+    # fall back to pip when it can't be fetched
+    for installer in (UV_INSTALLER, "pip install uv"):
+        run_command(installer, check=False, capture=False)
+        if shutil.which("uv"):
             print("[OK] uv installed successfully")
-        except subprocess.CalledProcessError:
-            print("[WARN] uv installation failed - falling back to pip")
+            return True
 
-    # Sync dependencies and install pre-commit
-    try:
-        if uv_available:
-            print("[INSTALL] Syncing dependencies with uv...")
-            run_command("uv sync --all-extras")
-            run_command("uv tool install pre-commit")
-        else:
-            print("[INSTALL] Installing dependencies with pip...")
-            run_command("pip install -e .[dev]")
-            run_command("pip install pre-commit")
+    print("[WARN] uv installation failed - falling back to pip")
+    return False
 
-        # Install pre-commit hooks using uv when available for consistency
-        if uv_available:
-            run_command("uv run pre-commit install")
-        else:
-            run_command("pre-commit install")
-        print("[OK] Pre-commit hooks installed")
-    except subprocess.CalledProcessError:
-        print("[WARN] Dependency installation failed")
 
-    # Best-effort: format code and sort imports so lint passes out-of-the-box
+def create_initial_commit(
+    formatted: bool, message: str = "Initial commit from cookiecutter template"
+) -> bool:
+    """Record the project as the first commit on main.
+
+    A porcelain ``git commit`` runs whenever pre-commit hooks are installed or
+    commits must be signed, so the project's own hooks and ``commit.gpgSign``
+    apply. Only a Ruff-formatted tree with neither is committed with git
+    plumbing (write-tree/commit-tree), which runs no hooks and never signs.
+    """
     try:
-        if uv_available:
-            run_command("uv run ruff format")
-            run_command("uv run ruff check --fix .")
-        else:
-            run_command("ruff format")
-            run_command("ruff check --fix .")
-        print("[OK] Code formatted and imports sorted with Ruff")
+        run_command("git add -A")
     except subprocess.CalledProcessError:
-        print("[WARN] Ruff formatting skipped (environment not ready)")
+        print("[WARN] Initial commit failed")
+        return False
+
+    hooks_installed = (Path.cwd() / ".git" / "hooks" / "pre-commit").exists()
+    _, gpg_sign = run_silent(["git", "config", "--bool", "commit.gpgSign"])
+    if formatted and not hooks_installed and gpg_sign.strip() != "true":
+        rc, tree = run_silent(["git", "write-tree"])
+        if rc == 0:
+            rc, commit = run_silent(["git", "commit-tree", tree.strip(), "-m", message])
+            if rc == 0:
+                rc, _ = run_silent(
+                    ["git", "update-ref", "refs/heads/main", commit.strip()]
+                )
+    else:
+        if not formatted and not hooks_installed:
+            print("[WARN] Ruff did not run and pre-commit is not installed;")
+            print("       the initial commit may contain unformatted code")
+        rc = run_command(f'git commit -m "{message}"', check=False).returncode
+        if rc != 0:
+            # Pre-commit might modify files and fail the commit; -a restages
+            # those edits without walking the whole worktree again
+            print("[WARN] Initial commit attempt with pre-commit failed, retrying...")
+            rc = run_command(f'git commit -am "{message}"', check=False).returncode
+    if rc != 0:
+        print("[WARN] Initial commit failed")
+        return False
+    print("[OK] Initial commit created")
+    return True
 
-    # Create initial commit
-    try:
-        run_command("git add .")
+
+def main():
+    """Initialize the project after generation."""
+    project_dir = Path.cwd()
+    print(f"[INIT] Initializing project in {project_dir}")
+
+    skip_install = os.environ.get(SKIP_INSTALL_ENV_VAR) == "1"
+
+    # Detect (or install) uv before the concurrent stages start: installing it
+    # prepends ~/.local/bin to PATH, which must not change under subprocesses
+    # spawned by other threads, and its installer output stays in one block
+    uv_available = False if skip_install else ensure_uv()
+
+    # Python version tokens, cruft tracking and git init don't depend on each
+    # other, so run them concurrently. git init stays apart from the initial
+    # commit: that one needs `pre-commit install` to have run first (so its
+    # hooks, and the -am retry after they fix files, apply) and Ruff's
+    # formatting, both of which come after the install below
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        stages = [
+            executor.submit(setup_python_versions),
+            executor.submit(setup_cruft_tracking),
+            executor.submit(init_git_repository),
+        ]
+        for stage in stages:
+            stage.result()
+
+    # Clean up any placeholder files or directories left from template rendering
+    remove_placeholders(project_dir)
+
+    formatted = False
+    if skip_install:
+        # `uv run ruff` would sync the environment anyway, so formatting is
+        # skipped along with the install
+        print(f"[SKIP] Dependency installation skipped ({SKIP_INSTALL_ENV_VAR}=1)")
+    else:
+        # Sync dependencies and install pre-commit
         try:
-            run_command(
-                'git commit -m "Initial commit from cookiecutter template"', check=False
-            )
-            print("[OK] Initial commit created")
+            if uv_available:
+                print("[INSTALL] Syncing dependencies with uv...")
+                # Install pre-commit hooks using uv for consistency
+                run_batch(
+                    [
+                        "uv sync --all-extras",
+                        "uv tool install pre-commit",
+                        "uv run pre-commit install",
+                    ],
+                    capture=False,
+                )
+            else:
+                print("[INSTALL] Installing dependencies with pip...")
+                run_batch(
+                    [
+                        "pip install -e .[dev]",
+                        "pip install pre-commit",
+                        "pre-commit install",
+                    ],
+                    capture=False,
+                )
+            print("[OK] Pre-commit hooks installed")
         except subprocess.CalledProcessError:
-            # Pre-commit might modify files and fail the commit
-            print("[WARN] Initial commit attempt with pre-commit failed, retrying...")
-            run_command("git add .")
-            run_command(
-                'git commit -m "Initial commit from cookiecutter template"', check=False
-            )
-    except subprocess.CalledProcessError:
-        print("[WARN] Initial commit failed")
+            print("[WARN] Dependency installation failed")
+
+        # Best-effort: format code and sort imports so lint passes out-of-the-box
+        try:
+            if uv_available:
+                run_batch(["uv run ruff format", "uv run ruff check --fix ."])
+            else:
+                run_batch(["ruff format", "ruff check --fix ."])
+            formatted = True
+            print("[OK] Code formatted and imports sorted with Ruff")
+        except subprocess.CalledProcessError:
+            print("[WARN] Ruff formatting skipped (environment not ready)")
+
+    # Create initial commit
+    create_initial_commit(formatted)
 
     print("\n[SUCCESS] Project successfully initialized!")
     print("\nNext steps:")
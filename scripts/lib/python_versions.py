@@ -7,6 +7,10 @@ import re
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 PYPROJECT = ROOT / "pyproject.toml"
 
+_MIN_RE = re.compile(r">=?\s*3\.(\d+)")
+_MAX_RE = re.compile(r"<\s*3\.(\d+)")
+_REQUIRES_RE = re.compile(r"requires-python\s*=\s*\"([^\"]+)\"")
+
 
 def _read_pyproject_text() -> str:
     return PYPROJECT.read_text(encoding="utf-8")
@@ -19,8 +23,8 @@ def parse_requires_python(spec: str) -> tuple[str, str]:
     - ">=3.10,<3.13" -> ("3.10", "3.12")
     - ">=3.12"       -> ("3.12", "3.12")
     """
-    min_m = re.search(r">=?\s*3\.(\d+)", spec)
-    max_m = re.search(r"<\s*3\.(\d+)", spec)
+    min_m = _MIN_RE.search(spec)
+    max_m = _MAX_RE.search(spec)
     lo = int(min_m.group(1)) if min_m else 10
     hi = (int(max_m.group(1)) - 1) if max_m else lo
     return f"3.{lo}", f"3.{hi}"
@@ -28,7 +32,7 @@ def parse_requires_python(spec: str) -> tuple[str, str]:
 
 def compute_min_max() -> tuple[str, str]:
     text = _read_pyproject_text()
-    m = re.search(r"requires-python\s*=\s*\"([^\"]+)\"", text)
+    m = _REQUIRES_RE.search(text)
     spec = m.group(1) if m else ">=3.10"
     return parse_requires_python(spec)
 
@@ -14,26 +14,44 @@ Exit with non-zero if any violations are found.
 from __future__ import annotations
 
 import re
+from functools import cache
 from pathlib import Path
 
 import yaml
 
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 ROOT = Path(__file__).resolve().parents[1]
 TEMPLATE_ROOT = ROOT / "{{cookiecutter.repo_name}}"
 
+# bare PY_MIN not wrapped with underscores
+_BARE_PY_MIN_RE = re.compile(r"(?<!_)\bPY_MIN\b(?!_)")
+
 
 def _workflow_files() -> list[Path]:
     """Return sorted list of workflow files with .yml and .yaml extensions."""
     workflows_dir = TEMPLATE_ROOT / ".github" / "workflows"
-    files = set(workflows_dir.glob("*.yml")) | set(workflows_dir.glob("*.yaml"))
+    files = (p for p in workflows_dir.iterdir() if p.suffix in {".yml", ".yaml"})
     return sorted(files, key=lambda p: p.name)
 
 
+@cache
+def _workflow_texts() -> dict[Path, str]:
+    """Read each workflow once; both workflow checks share the contents."""
+    return {yml: yml.read_text(encoding="utf-8") for yml in _workflow_files()}
+
+
 def check_workflows_raw_wrapping() -> list[str]:
     errors: list[str] = []
-    for yml in _workflow_files():
+    for yml, text in _workflow_texts().items():
+        # Raw-block state only matters for lines with expressions
+        if "${{" not in text:
+            continue
         in_raw = False
-        for lineno, line in enumerate(yml.read_text(encoding="utf-8").splitlines(), 1):
+        for lineno, line in enumerate(text.splitlines(), 1):
             # Check for GitHub expression occurrences on this line
             if "${{" in line:
                 is_inline_wrapped = (
@@ -61,17 +79,16 @@ def check_readme_py_min_token() -> list[str]:
     readme = TEMPLATE_ROOT / "README.md"
     if readme.exists():
         text = readme.read_text(encoding="utf-8")
-        # flag bare PY_MIN not wrapped with underscores
-        if re.search(r"(?<!_)\bPY_MIN\b(?!_)", text):
+        if _BARE_PY_MIN_RE.search(text):
             errors.append(f"{readme}: use __PY_MIN__ token, not bare PY_MIN")
     return errors
 
 
 def check_template_workflows_are_valid_yaml() -> list[str]:
     errors: list[str] = []
-    for yml in _workflow_files():
+    for yml, text in _workflow_texts().items():
         try:
-            yaml.safe_load(yml.read_text(encoding="utf-8"))
+            yaml.load(text, Loader=_YamlLoader)
         except Exception as e:
             errors.append(f"{yml}: invalid YAML: {e}")
     return errors
@@ -0,0 +1,135 @@
+"""Shared fixtures for the template test suite."""
+
+import os
+import tomllib
+from collections.abc import Callable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Tool-managed trees in a generated project that tests never inspect
+_UNTRACKED_DIRS = frozenset({".git", ".venv"})
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add ``--run-slow`` to opt into the tests that install a project."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (full uv sync of a generated project)",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip tests marked slow unless ``--run-slow`` was given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_cache(tmp_path_factory: pytest.TempPathFactory):
+    """Point ``XDG_CACHE_HOME`` at a session directory for every render.
+
+    The post-gen hook caches discovered Python versions there; sharing the
+    developer's real cache would let one run skip discovery for the next.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("xdg-cache")))
+        yield
+
+
+def _render(output_dir: Path, *extra_context: str) -> Path:
+    """Render the template into ``output_dir`` and return the project path.
+
+    ``extra_context`` takes ``key=value`` overrides, as on the command line.
+    Rendering happens in-process; only the post-gen hook runs as a subprocess.
+    Without cookiecutter installed, the requesting tests skip instead of the
+    whole suite failing at import.
+    """
+    cookiecutter = pytest.importorskip("cookiecutter.main").cookiecutter
+    project_dir = cookiecutter(
+        str(ROOT),
+        no_input=True,
+        extra_context=dict(item.split("=", 1) for item in extra_context),
+        output_dir=str(output_dir),
+    )
+    return Path(project_dir)
+
+
+@pytest.fixture(scope="session")
+def test_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Generate the "Test Project" once per session and return its path.
+
+    Rendering runs the post-gen hook (git init, dependency sync, ...), which
+    dominates test time, so tests that only inspect the output share one copy.
+    """
+    return _render(
+        tmp_path_factory.mktemp("test-project"),
+        "project_name=Test Project",
+        "repo_name=test-project",
+    )
+
+
+@pytest.fixture(scope="session")
+def default_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Generate a project with the template defaults once per session."""
+    return _render(tmp_path_factory.mktemp("default"))
+
+
+@pytest.fixture(scope="session")
+def default_text(default_project: Path) -> Callable[[str], str]:
+    """Return a reader for files in ``default_project``, keyed by relative path.
+
+    Several tests inspect the same files (pyproject.toml, Makefile, ...), so
+    each one is read from disk once per session.
+    """
+    return cache(lambda relpath: (default_project / relpath).read_text())
+
+
+@pytest.fixture(scope="session")
+def default_files(default_project: Path) -> frozenset[str]:
+    """Return the POSIX paths of all files in ``default_project``.
+
+    One walk of the tree answers every existence check, instead of a
+    ``stat()`` per assertion.
+    """
+    files = []
+    for dirpath, dirnames, filenames in os.walk(default_project):
+        dirnames[:] = [name for name in dirnames if name not in _UNTRACKED_DIRS]
+        rel = Path(dirpath).relative_to(default_project).as_posix()
+        prefix = "" if rel == "." else f"{rel}/"
+        files.extend(prefix + name for name in filenames)
+    return frozenset(files)
+
+
+@pytest.fixture(scope="session")
+def default_pyproject(default_text: Callable[[str], str]) -> dict[str, Any]:
+    """Return the parsed pyproject.toml of ``default_project``."""
+    return tomllib.loads(default_text("pyproject.toml"))
+
+
+@pytest.fixture(scope="session")
+def project(tmp_path_factory: pytest.TempPathFactory) -> Callable[..., Path]:
+    """Return a factory generating a project for ``key=value`` overrides.
+
+    Renders are memoized on the overrides (in any order), so tests asking for
+    the same options share one generation per session, however pytest orders
+    them. Call as ``project("ai_agents=all", "project_type=paper")``.
+    """
+
+    @cache
+    def render(overrides: frozenset[str]) -> Path:
+        return _render(tmp_path_factory.mktemp("project"), *sorted(overrides))
+
+    return lambda *overrides: render(frozenset(overrides))
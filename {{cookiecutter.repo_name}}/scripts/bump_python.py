@@ -4,13 +4,15 @@ import pathlib
 import re
 import sys
 
-import tomllib
-import tomli_w
-
-
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 PYPROJECT = ROOT / "pyproject.toml"
 
+_MINOR_RE = re.compile(r"\d+\.\d+")
+_LOWER_BOUND_RE = re.compile(r">=?\s*3\.\d+")
+# Only the requires-python value changes, so edit it in place rather than
+# round-tripping the whole document through a TOML parser and writer
+_REQUIRES_RE = re.compile(r'^(requires-python\s*=\s*")([^"]*)(")', re.MULTILINE)
+
 
 def main() -> None:
     if "--to" not in sys.argv:
@@ -24,21 +26,25 @@ def main() -> None:
         )
 
     to = sys.argv[idx + 1]
-    if not re.fullmatch(r"\d+\.\d+", to):
+    if not _MINOR_RE.fullmatch(to):
         sys.exit(
             f"Error: invalid Python version '{to}'. Expected MAJOR.MINOR like 3.12"
         )
 
     text = PYPROJECT.read_text(encoding="utf-8")
-    doc = tomllib.loads(text)
-    proj = doc.setdefault("project", {})
-
-    old = proj.get("requires-python", ">=3.10")
-    new = re.sub(r">=?\s*3\.\d+", f">={to}", old) if ">=" in old else f">={to}"
-    proj["requires-python"] = new
-
-    PYPROJECT.write_text(tomli_w.dumps(doc), encoding="utf-8")
-    print(f"Updated requires-python={proj['requires-python']} for {to}")
+    m = _REQUIRES_RE.search(text)
+    if not m:
+        sys.exit(f"Error: no requires-python entry found in {PYPROJECT}")
+
+    old = m.group(2)
+    new = _LOWER_BOUND_RE.sub(f">={to}", old) if ">=" in old else f">={to}"
+    if new == old:
+        print(f"requires-python={old} already targets {to}; nothing to do")
+        return
+
+    text = text[: m.start(2)] + new + text[m.end(2) :]
+    PYPROJECT.write_text(text, encoding="utf-8")
+    print(f"Updated requires-python={new} for {to}")
 
 
 if __name__ == "__main__":
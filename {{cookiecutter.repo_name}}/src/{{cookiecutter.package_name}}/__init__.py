@@ -3,15 +3,25 @@
 """
 
 import os
-from importlib import metadata as _metadata
 
 __all__ = ["__version__"]
 
-try:
-    __version__: str = _metadata.version(__name__)
-except _metadata.PackageNotFoundError:
-    # Package is not installed
-    __version__ = "0.0.0+dev"
+
+def __getattr__(name: str) -> str:
+    # Resolve __version__ on first access (PEP 562): the metadata lookup scans
+    # sys.path, so plain imports of the package don't pay for it.
+    if name == "__version__":
+        from importlib import metadata
+
+        try:
+            version = metadata.version(__name__)
+        except metadata.PackageNotFoundError:
+            # Package is not installed
+            version = "0.0.0+dev"
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # -- Development-only runtime type-checking ------------------------------
 if os.getenv("DEV_TYPECHECK", "0") == "1":